@@ -18,20 +18,21 @@ from .const import (
     CONF_IMPORT_LABEL,
     CONF_IMPORT_LABELS,
     CONF_INSTANCE,
-    CONF_PUBLISH_MODE,
-    DEFAULT_PUBLISH_MODE,
     DOMAIN,
     hub_display_name,
     PUBLISH_MODE_LABELS,
     published_entity_id,
     published_observer_platform,
     published_observer_unique_id,
+    as_int,
+    as_string_list,
 )
 from .discovery import (
     entity_mapping_candidates,
     entity_exists,
     entity_ids_for_labels,
     mapping_friendly_name,
+    mapping_friendly_name_from_state,
     mapping_key,
 )
 
@@ -59,6 +60,17 @@ PLATFORMS: List[str] = ["sensor", "number", "switch", "select", "text", "binary_
 # back to entry.options (once). We then suppress the reload.
 PERSIST_FRIENDLY_ON_START = True
 
+_MANAGED_TYPE_SLUGS = frozenset({"analog-value", "binary-value", "multi-state-value"})
+# Candidate fields copied onto a mapping only when set (in stored key order).
+_CANDIDATE_OPTIONAL_KEYS = (
+    "source_attr",
+    "read_attr",
+    "write_action",
+    "mv_states",
+    "hvac_on_mode",
+    "hvac_off_mode",
+)
+
 
 def _ensure_domain(hass: HomeAssistant) -> Dict[str, Any]:
     hass.data.setdefault(DOMAIN, {})
@@ -73,31 +85,6 @@ def _ensure_domain(hass: HomeAssistant) -> Dict[str, Any]:
     return hass.data[DOMAIN]
 
 
-def _normalize_publish_mode(value: Any) -> str:
-    mode = str(value or DEFAULT_PUBLISH_MODE).strip().lower()
-    if mode == PUBLISH_MODE_LABELS:
-        return mode
-    return PUBLISH_MODE_LABELS
-
-
-def _as_int(value: Any, fallback: int = 0) -> int:
-    try:
-        return int(value)
-    except Exception:
-        return fallback
-
-
-def _as_string_list(value: Any) -> list[str]:
-    if value is None:
-        return []
-    if isinstance(value, str):
-        txt = value.strip()
-        return [txt] if txt else []
-    if isinstance(value, (list, tuple, set)):
-        return [str(item).strip() for item in value if str(item).strip()]
-    return []
-
-
 def _adapter_get(entry: Any, key: str, default: Any = None) -> Any:
     if isinstance(entry, dict):
         return entry.get(key, default)
@@ -183,11 +170,15 @@ def _options_fingerprint(options: Dict[str, Any]) -> str:
 def _refresh_friendly_names_inplace(hass: HomeAssistant, published: List[Dict[str, Any]]) -> bool:
     """Update friendly_name in-place from current HA state."""
     changed = False
+    # Climate entities fan out into several mappings; look each state up once.
+    states: Dict[str, Any] = {}
     for mapping in (published or []):
         entity_id = mapping.get("entity_id")
         if not entity_id:
             continue
-        new_name = mapping_friendly_name(hass, mapping)
+        if entity_id not in states:
+            states[entity_id] = hass.states.get(entity_id)
+        new_name = mapping_friendly_name_from_state(states[entity_id], mapping)
         old_name = mapping.get("friendly_name")
         if new_name and new_name != old_name:
             mapping["friendly_name"] = new_name
@@ -216,7 +207,7 @@ def _ensure_counter_floor(counters: Dict[str, int], published: List[Dict[str, An
         object_type = str(mapping.get("object_type") or "")
         if not object_type:
             continue
-        instance = _as_int(mapping.get("instance"), -1)
+        instance = as_int(mapping.get("instance"), -1)
         if instance < 0:
             continue
         prev = max_by_type.get(object_type, -1)
@@ -225,50 +216,41 @@ def _ensure_counter_floor(counters: Dict[str, int], published: List[Dict[str, An
 
     for object_type, max_instance in max_by_type.items():
         floor = max_instance + 1
-        current = _as_int(counters.get(object_type), 0)
+        current = as_int(counters.get(object_type), 0)
         if current < floor:
             counters[object_type] = floor
             changed = True
     return changed
 
 
-def _next_higher_instance(
-    object_type: str,
-    counters: Dict[str, int],
-    published: List[Dict[str, Any]],
-) -> int:
-    max_instance = -1
-    for mapping in published:
-        if mapping.get("object_type") != object_type:
-            continue
-        inst = _as_int(mapping.get("instance"), -1)
-        if inst > max_instance:
-            max_instance = inst
-
-    floor = max_instance + 1
-    return max(_as_int(counters.get(object_type), 0), floor)
+def _index_instance(
+    used_by_type: Dict[str, set[int]],
+    max_by_type: Dict[str, int],
+    mapping: Dict[str, Any],
+) -> None:
+    object_type = mapping.get("object_type")
+    inst = as_int(mapping.get("instance"), -1)
+    if inst > max_by_type.get(object_type, -1):
+        max_by_type[object_type] = inst
+    if inst >= 0:
+        used_by_type.setdefault(object_type, set()).add(inst)
 
 
 def _allocate_instance(
     object_type: str,
     counters: Dict[str, int],
-    published: List[Dict[str, Any]],
+    used_by_type: Dict[str, set[int]],
+    max_by_type: Dict[str, int],
     preferred: int | None = None,
 ) -> int:
-    used: set[int] = set()
-    for mapping in published:
-        if mapping.get("object_type") != object_type:
-            continue
-        inst = _as_int(mapping.get("instance"), -1)
-        if inst >= 0:
-            used.add(inst)
-
+    used = used_by_type.get(object_type, ())
     if preferred is not None and preferred >= 0 and preferred not in used:
         instance = preferred
     else:
-        instance = _next_higher_instance(object_type, counters, published)
+        floor = max_by_type.get(object_type, -1) + 1
+        instance = max(as_int(counters.get(object_type), 0), floor)
 
-    counters[object_type] = max(_as_int(counters.get(object_type), 0), instance + 1)
+    counters[object_type] = max(as_int(counters.get(object_type), 0), instance + 1)
     return instance
 
 
@@ -286,7 +268,7 @@ def _expected_unique_ids(entry: ConfigEntry, published: List[Dict[str, Any]]) ->
         if not isinstance(mapping, dict):
             continue
         obj_type = str(mapping.get("object_type") or "")
-        inst = _as_int(mapping.get("instance"), -1)
+        inst = as_int(mapping.get("instance"), -1)
         if inst < 0:
             continue
         entity_domain = published_observer_platform(mapping)
@@ -311,10 +293,9 @@ def _is_managed_published_unique_id(unique_id: str) -> bool:
         return False
     if parts[0] != DOMAIN or parts[1] != "hub":
         return False
-    managed_types = {"analog-value", "binary-value", "multi-state-value"}
-    if parts[-2] in managed_types:
+    if parts[-2] in _MANAGED_TYPE_SLUGS:
         return True
-    if len(parts) >= 6 and parts[-3] in managed_types:
+    if len(parts) >= 6 and parts[-3] in _MANAGED_TYPE_SLUGS:
         return True
     return False
 
@@ -330,11 +311,9 @@ def _cleanup_orphan_published_entities(
 
     for reg_entry in entries:
         unique_id = str(getattr(reg_entry, "unique_id", "") or "")
-        entity_id = getattr(reg_entry, "entity_id", None)
-        if not _is_managed_published_unique_id(unique_id):
-            continue
-        if unique_id in expected:
+        if unique_id in expected or not _is_managed_published_unique_id(unique_id):
             continue
+        entity_id = getattr(reg_entry, "entity_id", None)
         if not entity_id:
             continue
         try:
@@ -405,7 +384,7 @@ def _normalize_published_entity_ids(
         if not isinstance(mapping, dict):
             continue
         object_type = str(mapping.get("object_type") or "")
-        instance = _as_int(mapping.get("instance"), -1)
+        instance = as_int(mapping.get("instance"), -1)
         if instance < 0:
             continue
 
@@ -445,7 +424,7 @@ def _auto_target_entity_ids(hass: HomeAssistant, options: Dict[str, Any], mode:
     if mode != PUBLISH_MODE_LABELS:
         return set()
 
-    label_ids = set(_as_string_list(options.get(CONF_IMPORT_LABELS)))
+    label_ids = set(as_string_list(options.get(CONF_IMPORT_LABELS)))
     if not label_ids:
         legacy_label = str(options.get(CONF_IMPORT_LABEL) or "").strip()
         if legacy_label:
@@ -476,13 +455,10 @@ async def _async_sync_auto_mappings(hass: HomeAssistant, entry_id: str) -> bool:
 
     had_legacy_mapping_keys = False
 
-    mode = _normalize_publish_mode(options.get(CONF_PUBLISH_MODE, DEFAULT_PUBLISH_MODE))
-    if mode != PUBLISH_MODE_LABELS:
-        options[CONF_PUBLISH_MODE] = PUBLISH_MODE_LABELS
-        mode = PUBLISH_MODE_LABELS
-        had_legacy_mapping_keys = True
+    # Labels is the only remaining publish mode; every stored value maps onto it.
+    mode = PUBLISH_MODE_LABELS
 
-    label_ids = _as_string_list(options.get(CONF_IMPORT_LABELS))
+    label_ids = as_string_list(options.get(CONF_IMPORT_LABELS))
     if not label_ids:
         legacy_label = str(options.get(CONF_IMPORT_LABEL) or "").strip()
         if legacy_label:
@@ -496,12 +472,13 @@ async def _async_sync_auto_mappings(hass: HomeAssistant, entry_id: str) -> bool:
             options[CONF_IMPORT_LABEL] = first_label
             had_legacy_mapping_keys = True
 
-    published: List[Dict[str, Any]] = list(options.get("published", []))
-    counters: Dict[str, int] = dict(options.get("counters", {}))
-    instance_hints: Dict[str, int] = dict(options.get("instance_hints", {}))
-    original_published = list(published)
-    original_counters = dict(counters)
-    original_instance_hints = dict(instance_hints)
+    # Only read here: every kept mapping is rebuilt from a dict() copy into `kept`.
+    published: List[Dict[str, Any]] = options.get("published") or []
+    # The stored dicts are never mutated, so they double as the change-check baseline.
+    original_counters: Dict[str, int] = options.get("counters", {})
+    original_instance_hints: Dict[str, int] = options.get("instance_hints", {})
+    counters: Dict[str, int] = dict(original_counters)
+    instance_hints: Dict[str, int] = dict(original_instance_hints)
 
     _ensure_counter_floor(counters, published)
     targets = _auto_target_entity_ids(hass, options, mode)
@@ -510,6 +487,28 @@ async def _async_sync_auto_mappings(hass: HomeAssistant, entry_id: str) -> bool:
     kept: List[Dict[str, Any]] = []
     existing_mapping_keys: set[str] = set()
     removed_count = 0
+    # Instances taken by kept mappings, per object type; updated as mappings are kept
+    # so allocation does not rescan the list.
+    used_by_type: Dict[str, set[int]] = {}
+    max_by_type: Dict[str, int] = {}
+
+    def _keep(mapping: Dict[str, Any], key: str) -> None:
+        kept.append(mapping)
+        existing_mapping_keys.add(key)
+        _index_instance(used_by_type, max_by_type, mapping)
+
+    # Climate entities fan out into several mappings, and targets are visited
+    # again when adding new mappings; classify and key each entity once per sync.
+    candidates_by_entity: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def _candidates(entity_id: str) -> Dict[str, Dict[str, Any]]:
+        cached = candidates_by_entity.get(entity_id)
+        if cached is None:
+            cached = {
+                mapping_key(spec): spec for spec in entity_mapping_candidates(hass, entity_id)
+            }
+            candidates_by_entity[entity_id] = cached
+        return cached
 
     for mapping in published:
         if not isinstance(mapping, dict):
@@ -538,7 +537,7 @@ async def _async_sync_auto_mappings(hass: HomeAssistant, entry_id: str) -> bool:
 
         key = mapping_key(current)
         current_object_type = str(current.get("object_type") or "")
-        current_instance = _as_int(current.get("instance"), -1)
+        current_instance = as_int(current.get("instance"), -1)
         if current_object_type and current_instance >= 0:
             instance_hints[_instance_hint_key(key, current_object_type)] = current_instance
         if key in existing_mapping_keys:
@@ -557,19 +556,15 @@ async def _async_sync_auto_mappings(hass: HomeAssistant, entry_id: str) -> bool:
             continue
         if entity_id not in targets:
             if startup_lenient:
-                kept.append(current)
-                existing_mapping_keys.add(key)
+                _keep(current, key)
                 continue
             removed_count += 1
             continue
 
-        candidates = entity_mapping_candidates(hass, entity_id)
-        candidate_by_key = {mapping_key(spec): spec for spec in candidates}
-        candidate = candidate_by_key.get(key)
+        candidate = _candidates(entity_id).get(key)
         if not candidate:
             if startup_lenient:
-                kept.append(current)
-                existing_mapping_keys.add(key)
+                _keep(current, key)
                 continue
             removed_count += 1
             continue
@@ -579,53 +574,36 @@ async def _async_sync_auto_mappings(hass: HomeAssistant, entry_id: str) -> bool:
         new_object_type = str(candidate.get("object_type") or "")
         if old_object_type != new_object_type:
             current["object_type"] = new_object_type
-            preferred = _as_int(instance_hints.get(_instance_hint_key(key, new_object_type)), -1)
+            preferred = as_int(instance_hints.get(_instance_hint_key(key, new_object_type)), -1)
             current["instance"] = _allocate_instance(
                 new_object_type,
                 counters,
-                kept,
+                used_by_type,
+                max_by_type,
                 preferred=preferred if preferred >= 0 else None,
             )
         else:
             current["object_type"] = new_object_type
-            instance_hints[_instance_hint_key(key, new_object_type)] = _as_int(
+            instance_hints[_instance_hint_key(key, new_object_type)] = as_int(
                 current.get("instance"), 0
             )
         current["units"] = candidate.get("units")
         current["friendly_name"] = str(
             candidate.get("friendly_name") or mapping_friendly_name(hass, current)
         )
-        if candidate.get("source_attr"):
-            current["source_attr"] = candidate.get("source_attr")
-        else:
-            current.pop("source_attr", None)
-        if candidate.get("read_attr"):
-            current["read_attr"] = candidate.get("read_attr")
-        else:
-            current.pop("read_attr", None)
-        if candidate.get("write_action"):
-            current["write_action"] = candidate.get("write_action")
-        else:
-            current.pop("write_action", None)
-        if candidate.get("mv_states"):
-            current["mv_states"] = list(candidate.get("mv_states") or [])
-        else:
-            current.pop("mv_states", None)
-        if candidate.get("hvac_on_mode"):
-            current["hvac_on_mode"] = candidate.get("hvac_on_mode")
-        else:
-            current.pop("hvac_on_mode", None)
-        if candidate.get("hvac_off_mode"):
-            current["hvac_off_mode"] = candidate.get("hvac_off_mode")
-        else:
-            current.pop("hvac_off_mode", None)
-        if candidate.get("cov_increment") is not None:
-            current["cov_increment"] = float(candidate.get("cov_increment"))
+        for attr in _CANDIDATE_OPTIONAL_KEYS:
+            value = candidate.get(attr)
+            if value:
+                current[attr] = list(value) if attr == "mv_states" else value
+            else:
+                current.pop(attr, None)
+        cov_increment = candidate.get("cov_increment")
+        if cov_increment is not None:
+            current["cov_increment"] = float(cov_increment)
         else:
             current.pop("cov_increment", None)
 
-        kept.append(current)
-        existing_mapping_keys.add(key)
+        _keep(current, key)
 
     added_count = 0
     for entity_id in sorted(targets):
@@ -633,8 +611,7 @@ async def _async_sync_auto_mappings(hass: HomeAssistant, entry_id: str) -> bool:
             continue
         if startup_lenient and hass.states.get(entity_id) is None:
             continue
-        for candidate in entity_mapping_candidates(hass, entity_id):
-            key = mapping_key(candidate)
+        for key, candidate in _candidates(entity_id).items():
             if key in existing_mapping_keys:
                 continue
 
@@ -642,11 +619,12 @@ async def _async_sync_auto_mappings(hass: HomeAssistant, entry_id: str) -> bool:
             if not object_type:
                 continue
 
-            preferred = _as_int(instance_hints.get(_instance_hint_key(key, object_type)), -1)
+            preferred = as_int(instance_hints.get(_instance_hint_key(key, object_type)), -1)
             instance = _allocate_instance(
                 object_type,
                 counters,
-                kept,
+                used_by_type,
+                max_by_type,
                 preferred=preferred if preferred >= 0 else None,
             )
             instance_hints[_instance_hint_key(key, object_type)] = instance
@@ -661,27 +639,19 @@ async def _async_sync_auto_mappings(hass: HomeAssistant, entry_id: str) -> bool:
                 "auto": True,
                 "auto_mode": mode,
             }
-            if candidate.get("source_attr"):
-                new_map["source_attr"] = candidate.get("source_attr")
-            if candidate.get("read_attr"):
-                new_map["read_attr"] = candidate.get("read_attr")
-            if candidate.get("write_action"):
-                new_map["write_action"] = candidate.get("write_action")
-            if candidate.get("mv_states"):
-                new_map["mv_states"] = list(candidate.get("mv_states") or [])
-            if candidate.get("hvac_on_mode"):
-                new_map["hvac_on_mode"] = candidate.get("hvac_on_mode")
-            if candidate.get("hvac_off_mode"):
-                new_map["hvac_off_mode"] = candidate.get("hvac_off_mode")
-            if candidate.get("cov_increment") is not None:
-                new_map["cov_increment"] = float(candidate.get("cov_increment"))
-
-            kept.append(new_map)
-            existing_mapping_keys.add(key)
+            for attr in _CANDIDATE_OPTIONAL_KEYS:
+                value = candidate.get(attr)
+                if value:
+                    new_map[attr] = list(value) if attr == "mv_states" else value
+            cov_increment = candidate.get("cov_increment")
+            if cov_increment is not None:
+                new_map["cov_increment"] = float(cov_increment)
+
+            _keep(new_map, key)
             added_count += 1
 
     changed = (
-        (kept != original_published)
+        (kept != published)
         or (counters != original_counters)
         or (instance_hints != original_instance_hints)
         or had_legacy_ui_keys
@@ -1139,8 +1109,8 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
             return
 
         try:
-            current_published: List[Dict[str, Any]] = list(
-                (current_entry.options or {}).get("published", [])
+            current_published: List[Dict[str, Any]] = (
+                (current_entry.options or {}).get("published") or []
             )
             removed = _cleanup_orphan_published_entities(hass, current_entry, current_published)
             if removed:
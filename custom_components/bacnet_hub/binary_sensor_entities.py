@@ -18,6 +18,7 @@ from .const import (
     published_entity_id,
     published_observer_unique_id,
     published_suggested_object_id,
+    source_attr_name_suffix,
 )
 
 
@@ -47,6 +48,8 @@ class BacnetPublishedBinarySensor(BinarySensorEntity):
         self._hvac_on_mode = str(hvac_on_mode or "heat").strip().lower()
         self._instance = instance
         self._attr_name = name
+        self._name_prefix = f"(BACnet BV-{instance}) "
+        self._name_suffix = source_attr_name_suffix(self._source_attr)
         self._remove_listener = None
         self._late_unsub: Optional[Callable[[], None]] = None
         self._attr_unique_id = published_observer_unique_id(
@@ -132,11 +135,7 @@ class BacnetPublishedBinarySensor(BinarySensorEntity):
             return
 
         domain = st.entity_id.split(".", 1)[0]
-        src_name = st.name or self._source
-        if self._source_attr:
-            field_name = self._source_attr.replace("_", " ").title()
-            src_name = f"{src_name} {field_name}"
-        self._attr_name = f"(BACnet BV-{self._instance}) {src_name}"
+        self._attr_name = f"{self._name_prefix}{st.name or self._source}{self._name_suffix}"
 
         attr_name = self._read_attr or self._source_attr
         if attr_name and attr_name != "__state__":
@@ -182,7 +181,7 @@ class BacnetPublishedBinarySensor(BinarySensorEntity):
                 self._attr_icon = "mdi:lightbulb" if self._attr_is_on else "mdi:lightbulb-outline"
             else:
                 self._attr_icon = None
-        mirrored_attrs = mirrored_state_attributes(dict(st.attributes or {}))
+        mirrored_attrs = mirrored_state_attributes(st.attributes)
         mirrored_attrs["source_entity_id"] = self._source
         self._attr_extra_state_attributes = mirrored_attrs
         self.async_write_ha_state()
@@ -673,6 +673,8 @@ class BacnetClientPointSelect(BacnetClientPointEntityBase, SelectEntity):
         )
         self._attr_options: list[str] = []
         self._attr_current_option: str | None = None
+        # option text -> BACnet state index (1-based), first occurrence wins.
+        self._option_index: dict[str, int] = {}
 
     def _apply_point_state(self, point: dict[str, Any]) -> None:
         texts = point.get("state_text")
@@ -684,6 +686,10 @@ class BacnetClientPointSelect(BacnetClientPointEntityBase, SelectEntity):
             if count > 0:
                 options = [str(idx) for idx in range(1, min(count, 128) + 1)]
         self._attr_options = options
+        option_index: dict[str, int] = {}
+        for pos, text in enumerate(options, start=1):
+            option_index.setdefault(text, pos)
+        self._option_index = option_index
 
         idx = _to_int(point.get("present_value"))
         self._attr_current_option = None
@@ -695,11 +701,8 @@ class BacnetClientPointSelect(BacnetClientPointEntityBase, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         point = self._get_point()
         texts = point.get("state_text")
-        options = list(self.options or [])
-        value_index: int | None = None
-        if option in options:
-            value_index = options.index(option) + 1
-        elif isinstance(texts, (list, tuple)):
+        value_index = self._option_index.get(option)
+        if value_index is None and isinstance(texts, (list, tuple)):
             normalized = [str(item).strip() for item in texts]
             if option in normalized:
                 value_index = normalized.index(option) + 1
@@ -36,7 +36,9 @@ CLIENT_REFRESH_MIN_SECONDS = 55.0
 CLIENT_COV_LEASE_SECONDS = 300
 
 CLIENT_DIAGNOSTIC_FIELDS: list[tuple[str, str]] = list(HUB_DIAGNOSTIC_FIELDS)
-NETWORK_DIAGNOSTIC_KEYS = {"ip_address", "ip_subnet_mask", "mac_address_raw"}
+NETWORK_DIAGNOSTIC_KEYS = frozenset({"ip_address", "ip_subnet_mask", "mac_address_raw"})
+_BINARY_ACTIVE_TEXT = frozenset({"active", "on", "true", "1"})
+_BINARY_INACTIVE_TEXT = frozenset({"inactive", "off", "false", "0"})
 CLIENT_POINT_SUPPORTED_TYPES: dict[str, tuple[str, str]] = {
     "analoginput": ("ai", "analog-input"),
     "analogoutput": ("ao", "analog-output"),
@@ -58,6 +60,10 @@ def _to_state(value: Any) -> StateType:
 
 
 def _to_int(value: Any) -> int | None:
+    if type(value) is int:
+        return value
+    if value is None:
+        return None
     try:
         return int(value)
     except Exception:
@@ -488,10 +494,10 @@ def _point_native_value_from_payload(point: dict[str, Any]) -> StateType:
             pass
     if type_slug in {"bi", "bo", "bv"}:
         text = str(value).strip().lower()
-        if text in ("active", "on", "true", "1"):
+        if text in _BINARY_ACTIVE_TEXT:
             active_text = _safe_text(point.get("active_text"))
             return active_text or "active"
-        if text in ("inactive", "off", "false", "0"):
+        if text in _BINARY_INACTIVE_TEXT:
             inactive_text = _safe_text(point.get("inactive_text"))
             return inactive_text or "inactive"
         return str(value)
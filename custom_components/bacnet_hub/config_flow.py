@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
-import re
 import socket
+import time
 from typing import Any, Dict, Iterable, Optional
 
 import voluptuous as vol
@@ -25,6 +25,9 @@ from .const import (
     DEFAULT_IMPORT_LABEL_NAME,
     DOMAIN,
     PUBLISH_MODE_LABELS,
+    as_int,
+    as_string_list,
+    is_ascii_digits,
 )
 from .discovery import label_choices
 
@@ -37,29 +40,44 @@ MAX_INSTANCE = 4_194_302
 DEFAULT_PREFIX = 24
 DEFAULT_PORT = 47808
 
-_ADDR_RE = re.compile(
-    r"^\s*(?P<ip>(\d{1,3}\.){3}\d{1,3})"
-    r"(?:/(?P<prefix>\d{1,2}))?"
-    r"(?::(?P<port>\d{1,5}))?\s*$"
+# Form description placeholders
+_PLACEHOLDER_MIN = str(MIN_INSTANCE)
+_PLACEHOLDER_MAX = str(MAX_INSTANCE)
+_PLACEHOLDER_DEFAULT = str(DEFAULT_INSTANCE)
+_ADDR_HINT = "e.g. 192.168.31.36/24:47808"
+
+# Longest accepted address (24 characters).
+_ADDR_MAX_LEN = len("255.255.255.255/32:65535")
+_ERR_INVALID = "invalid_address"
+
+# Last successful routed local IP probe: (monotonic timestamp, ip).
+_LOCAL_IP_TTL = 300.0
+_LOCAL_IP_CACHE: Optional[tuple[float, str]] = None
+
+# Selectors carry no per-request state; only the vol.Required defaults vary.
+_INSTANCE_SEL = sel.NumberSelector(
+    sel.NumberSelectorConfig(
+        min=MIN_INSTANCE,
+        max=MAX_INSTANCE,
+        step=1,
+        mode=sel.NumberSelectorMode.BOX,
+    )
+)
+_TEXT_SEL = sel.TextSelector(
+    sel.TextSelectorConfig(multiline=False, type=sel.TextSelectorType.TEXT)
 )
 
 
-def _as_int(value: Any, fallback: int) -> int:
+def _parse_int(value: Any) -> Optional[int]:
+    # Like const.as_int, but returns None so form validation can flag unparseable input.
+    if type(value) is int:
+        return value
+    if value is None:
+        return None
     try:
         return int(value)
     except Exception:
-        return fallback
-
-
-def _as_string_list(value: Any) -> list[str]:
-    if value is None:
-        return []
-    if isinstance(value, str):
-        text = value.strip()
-        return [text] if text else []
-    if isinstance(value, (list, tuple, set)):
-        return [str(item).strip() for item in value if str(item).strip()]
-    return []
+        return None
 
 
 def _normalized_text(value: Any, fallback: str) -> str:
@@ -67,17 +85,29 @@ def _normalized_text(value: Any, fallback: str) -> str:
     return text or fallback
 
 
+def _cached_local_ip() -> Optional[str]:
+    cached = _LOCAL_IP_CACHE
+    if cached is not None and time.monotonic() - cached[0] < _LOCAL_IP_TTL:
+        return cached[1]
+    return None
+
+
 def _detect_local_ip() -> Optional[str]:
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.connect(("8.8.8.8", 80))
-        ip = sock.getsockname()[0]
-        sock.close()
-        socket.inet_aton(ip)
+    global _LOCAL_IP_CACHE
+
+    ip = _cached_local_ip()
+    if ip:
         return ip
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.connect(("8.8.8.8", 80))
+            ip = sock.getsockname()[0]
     except Exception as err:
         _LOGGER.debug("Could not detect local IP: %s", err)
         return None
+    # Only successful probes are cached; a failure is retried on the next render.
+    _LOCAL_IP_CACHE = (time.monotonic(), ip)
+    return ip
 
 
 def _adapter_get(entry: Any, key: str, default: Any = None) -> Any:
@@ -114,7 +144,9 @@ def _iter_adapter_ipv4(adapters: Iterable[Any]) -> Iterable[tuple[str, int, bool
 async def _async_detect_local_ipv4_and_prefix(
     hass: HomeAssistant,
 ) -> tuple[Optional[str], Optional[int]]:
-    routed_ip = _detect_local_ip()
+    routed_ip = _cached_local_ip()
+    if not routed_ip:
+        routed_ip = await hass.async_add_executor_job(_detect_local_ip)
 
     adapters: list[Any] = []
     try:
@@ -158,37 +190,30 @@ async def _async_default_address(hass: HomeAssistant) -> str:
 
 def _validate_bacnet_address(addr: str) -> Optional[str]:
     if not addr or not isinstance(addr, str):
-        return "invalid_address"
-
-    match = _ADDR_RE.match(addr)
-    if not match:
-        return "invalid_address"
-
-    ip = match.group("ip")
-    try:
-        parts = [int(x) for x in ip.split(".")]
-        if any(p < 0 or p > 255 for p in parts):
-            return "invalid_address"
-    except Exception:
-        return "invalid_address"
-
-    prefix = match.group("prefix")
-    if prefix is not None:
-        try:
-            prefix_int = int(prefix)
-            if prefix_int < 0 or prefix_int > 32:
-                return "invalid_address"
-        except Exception:
-            return "invalid_address"
-
-    port = match.group("port")
-    if port is not None:
-        try:
-            port_int = int(port)
-            if port_int < 1 or port_int > 65535:
-                return "invalid_address"
-        except Exception:
-            return "invalid_address"
+        return _ERR_INVALID
+
+    # Straight-line parse of "a.b.c.d[/prefix][:port]" after cheap length, first
+    # character and dot-count rejects. Same strip and digit rules as
+    # server._address_parts, so the UI never accepts an address the hub would
+    # later replace with the fallback.
+    text = addr.strip()
+    if len(text) > _ADDR_MAX_LEN or not text[:1].isdigit() or text.count(".") != 3:
+        return _ERR_INVALID
+
+    head, sep, port = text.rpartition(":")
+    if sep:
+        if not (is_ascii_digits(port, 5) and 1 <= int(port) <= 65535):
+            return _ERR_INVALID
+    else:
+        head = text
+
+    ip, sep, prefix = head.partition("/")
+    if sep and not (is_ascii_digits(prefix, 2) and int(prefix) <= 32):
+        return _ERR_INVALID
+
+    for octet in ip.split("."):
+        if not (is_ascii_digits(octet, 3) and int(octet) <= 255):
+            return _ERR_INVALID
 
     return None
 
@@ -280,8 +305,50 @@ async def _async_ensure_default_label(hass: HomeAssistant) -> str:
     return ""
 
 
+def _validate_hub_input(
+    user_input: Dict[str, Any],
+    fallback_instance: Optional[int],
+    default_address: str,
+) -> tuple[int, str, Dict[str, str]]:
+    errors: Dict[str, str] = {}
+    inst = _parse_int(user_input.get("instance"))
+    if inst is None:
+        inst = fallback_instance
+    if inst is None:
+        # Unparseable instance and nothing to fall back to.
+        errors["instance"] = "invalid_int"
+        inst = DEFAULT_INSTANCE
+    elif inst < MIN_INSTANCE or inst > MAX_INSTANCE:
+        errors["instance"] = "invalid_int"
+
+    addr = (user_input.get("address") or "").strip() or default_address
+    err = _validate_bacnet_address(addr)
+    if err:
+        errors["address"] = err
+    return inst, addr, errors
+
+
+def _label_view(
+    label_options: list[tuple[str, str]],
+) -> tuple[frozenset[str], sel.SelectSelector]:
+    # Valid label ids and the label selector, built in one pass over the choices.
+    ids: list[str] = []
+    select_options: list[sel.SelectOptionDict] = []
+    for label_id, label_name in label_options:
+        ids.append(label_id)
+        select_options.append(sel.SelectOptionDict(value=label_id, label=label_name))
+    selector = sel.SelectSelector(
+        sel.SelectSelectorConfig(
+            options=select_options,
+            mode=sel.SelectSelectorMode.DROPDOWN,
+            multiple=True,
+        )
+    )
+    return frozenset(ids), selector
+
+
 def _current_labels_from_store(store: Dict[str, Any]) -> list[str]:
-    labels = _as_string_list(store.get(CONF_IMPORT_LABELS))
+    labels = as_string_list(store.get(CONF_IMPORT_LABELS))
     if labels:
         return labels
 
@@ -296,27 +363,14 @@ class BacnetHubConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: Dict[str, str] = {}
         default_address = await _async_default_address(self.hass)
         placeholders = {
-            "min": f"{MIN_INSTANCE}",
-            "max": "4194302",
-            "default": f"{DEFAULT_INSTANCE}",
-            "addr_hint": "e.g. 192.168.31.36/24:47808",
+            "min": _PLACEHOLDER_MIN,
+            "max": _PLACEHOLDER_MAX,
+            "default": _PLACEHOLDER_DEFAULT,
+            "addr_hint": _ADDR_HINT,
         }
 
         if user_input is not None:
-            try:
-                inst = int(user_input.get("instance", DEFAULT_INSTANCE))
-                if inst < MIN_INSTANCE or inst > MAX_INSTANCE:
-                    raise ValueError
-            except Exception:
-                errors["instance"] = "invalid_int"
-                inst = DEFAULT_INSTANCE
-
-            addr = (user_input.get("address") or "").strip()
-            if not addr:
-                addr = default_address
-            err = _validate_bacnet_address(addr)
-            if err:
-                errors["address"] = err
+            inst, addr, errors = _validate_hub_input(user_input, None, default_address)
 
             object_name = _normalized_text(
                 user_input.get(CONF_DEVICE_NAME), DEFAULT_BACNET_OBJECT_NAME
@@ -352,25 +406,12 @@ class BacnetHubConfigFlow(ConfigFlow, domain=DOMAIN):
 
         schema = vol.Schema(
             {
-                vol.Required("instance", default=DEFAULT_INSTANCE): sel.NumberSelector(
-                    sel.NumberSelectorConfig(
-                        min=MIN_INSTANCE,
-                        max=MAX_INSTANCE,
-                        step=1,
-                        mode=sel.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Required("address", default=default_address): sel.TextSelector(
-                    sel.TextSelectorConfig(multiline=False, type=sel.TextSelectorType.TEXT)
-                ),
-                vol.Required(CONF_DEVICE_NAME, default=DEFAULT_BACNET_OBJECT_NAME): sel.TextSelector(
-                    sel.TextSelectorConfig(multiline=False, type=sel.TextSelectorType.TEXT)
-                ),
+                vol.Required("instance", default=DEFAULT_INSTANCE): _INSTANCE_SEL,
+                vol.Required("address", default=default_address): _TEXT_SEL,
+                vol.Required(CONF_DEVICE_NAME, default=DEFAULT_BACNET_OBJECT_NAME): _TEXT_SEL,
                 vol.Required(
                     CONF_DEVICE_DESCRIPTION, default=DEFAULT_BACNET_DEVICE_DESCRIPTION
-                ): sel.TextSelector(
-                    sel.TextSelectorConfig(multiline=False, type=sel.TextSelectorType.TEXT)
-                ),
+                ): _TEXT_SEL,
             }
         )
         return self.async_show_form(
@@ -415,14 +456,44 @@ class BacnetHubOptionsFlow(OptionsFlow):
         self._opts.pop("_edit_index", None)
         self._previous_mode = str(self._opts.get(CONF_PUBLISH_MODE) or "").strip().lower()
         self._previous_labels = set(_current_labels_from_store(self._opts))
+        self._label_choices: Optional[list[tuple[str, str]]] = None
+        self._default_label_id: Optional[str] = None
+        self._device_defaults: Optional[tuple[int, str]] = None
+
+    async def _async_device_defaults(self) -> tuple[int, str]:
+        # Resolved once per flow; only probe the network when no address is stored.
+        if self._device_defaults is None:
+            address = str(self._opts.get("address") or "")
+            if not address:
+                address = await _async_default_address(self.hass)
+            self._device_defaults = (
+                as_int(self._opts.get("instance", DEFAULT_INSTANCE), DEFAULT_INSTANCE),
+                address,
+            )
+        return self._device_defaults
+
+    def _cached_label_choices(self) -> list[tuple[str, str]]:
+        # The label registry rarely changes while the options dialog is open;
+        # walk and sort it once per flow instead of on every show/submit.
+        if self._label_choices is None:
+            self._label_choices = label_choices(self.hass)
+        return self._label_choices
+
+    async def _async_default_label_id(self) -> str:
+        # Resolve (and create, if missing) the default label once per flow;
+        # a failed lookup ("") is not kept, so the next step tries again.
+        if not self._default_label_id:
+            self._default_label_id = await _async_ensure_default_label(self.hass)
+            if self._default_label_id:
+                # The label may have just been created; list it in the choices.
+                self._label_choices = None
+        return self._default_label_id
 
     async def async_step_init(self, user_input: Optional[Dict] = None) -> ConfigFlowResult:
         return await self.async_step_device(user_input)
 
     async def async_step_device(self, user_input: Optional[Dict] = None) -> ConfigFlowResult:
-        detected_default = await _async_default_address(self.hass)
-        current_instance = _as_int(self._opts.get("instance", DEFAULT_INSTANCE), DEFAULT_INSTANCE)
-        current_address = str(self._opts.get("address") or detected_default)
+        current_instance, current_address = await self._async_device_defaults()
         current_object_name = _normalized_text(
             self._opts.get(CONF_DEVICE_NAME), DEFAULT_BACNET_OBJECT_NAME
         )
@@ -430,9 +501,9 @@ class BacnetHubOptionsFlow(OptionsFlow):
             self._opts.get(CONF_DEVICE_DESCRIPTION), DEFAULT_BACNET_DEVICE_DESCRIPTION
         )
 
-        default_label_id = await _async_ensure_default_label(self.hass)
-        label_options = label_choices(self.hass)
-        available_ids = {label_id for label_id, _ in label_options}
+        default_label_id = await self._async_default_label_id()
+        label_options = self._cached_label_choices()
+        available_ids, label_selector = _label_view(label_options)
 
         current_labels = [
             item for item in _current_labels_from_store(self._opts) if item in available_ids
@@ -441,24 +512,15 @@ class BacnetHubOptionsFlow(OptionsFlow):
             current_labels = [default_label_id]
 
         placeholders = {
-            "min": f"{MIN_INSTANCE}",
-            "max": "4194302",
-            "current": f"{current_instance}",
-            "addr_hint": "e.g. 192.168.31.36/24:47808",
+            "min": _PLACEHOLDER_MIN,
+            "max": _PLACEHOLDER_MAX,
+            "current": str(current_instance),
+            "addr_hint": _ADDR_HINT,
         }
 
         errors: Dict[str, str] = {}
         if user_input is not None:
-            inst = _as_int(user_input.get("instance"), current_instance)
-            if inst < MIN_INSTANCE or inst > MAX_INSTANCE:
-                errors["instance"] = "invalid_int"
-
-            addr = (user_input.get("address") or "").strip()
-            if not addr:
-                addr = current_address or detected_default
-            err = _validate_bacnet_address(addr)
-            if err:
-                errors["address"] = err
+            inst, addr, errors = _validate_hub_input(user_input, current_instance, current_address)
 
             object_name = _normalized_text(
                 user_input.get(CONF_DEVICE_NAME), current_object_name
@@ -467,7 +529,7 @@ class BacnetHubOptionsFlow(OptionsFlow):
                 user_input.get(CONF_DEVICE_DESCRIPTION), current_device_description
             )
 
-            selected_labels = _as_string_list(user_input.get(CONF_IMPORT_LABELS))
+            selected_labels = as_string_list(user_input.get(CONF_IMPORT_LABELS))
             selected_labels = [label_id for label_id in selected_labels if label_id in available_ids]
             if not selected_labels:
                 errors[CONF_IMPORT_LABELS] = "invalid_label_selection"
@@ -475,41 +537,20 @@ class BacnetHubOptionsFlow(OptionsFlow):
             if not errors:
                 self._opts["instance"] = inst
                 self._opts["address"] = addr
+                self._device_defaults = (inst, addr)
                 self._opts[CONF_DEVICE_NAME] = object_name
                 self._opts[CONF_DEVICE_DESCRIPTION] = device_description
                 return await self.async_step_labels()
 
         schema = vol.Schema(
             {
-                vol.Required("instance", default=current_instance): sel.NumberSelector(
-                    sel.NumberSelectorConfig(
-                        min=MIN_INSTANCE,
-                        max=MAX_INSTANCE,
-                        step=1,
-                        mode=sel.NumberSelectorMode.BOX,
-                    )
-                ),
-                vol.Required("address", default=current_address): sel.TextSelector(
-                    sel.TextSelectorConfig(multiline=False, type=sel.TextSelectorType.TEXT)
-                ),
-                vol.Required(CONF_DEVICE_NAME, default=current_object_name): sel.TextSelector(
-                    sel.TextSelectorConfig(multiline=False, type=sel.TextSelectorType.TEXT)
-                ),
+                vol.Required("instance", default=current_instance): _INSTANCE_SEL,
+                vol.Required("address", default=current_address): _TEXT_SEL,
+                vol.Required(CONF_DEVICE_NAME, default=current_object_name): _TEXT_SEL,
                 vol.Required(
                     CONF_DEVICE_DESCRIPTION, default=current_device_description
-                ): sel.TextSelector(
-                    sel.TextSelectorConfig(multiline=False, type=sel.TextSelectorType.TEXT)
-                ),
-                vol.Required(CONF_IMPORT_LABELS, default=current_labels): sel.SelectSelector(
-                    sel.SelectSelectorConfig(
-                        options=[
-                            sel.SelectOptionDict(value=label_id, label=label_name)
-                            for label_id, label_name in label_options
-                        ],
-                        mode=sel.SelectSelectorMode.DROPDOWN,
-                        multiple=True,
-                    )
-                ),
+                ): _TEXT_SEL,
+                vol.Required(CONF_IMPORT_LABELS, default=current_labels): label_selector,
             }
         )
         return self.async_show_form(
@@ -520,9 +561,9 @@ class BacnetHubOptionsFlow(OptionsFlow):
         )
 
     async def async_step_labels(self, user_input: Optional[Dict] = None) -> ConfigFlowResult:
-        default_label_id = await _async_ensure_default_label(self.hass)
-        label_options = label_choices(self.hass)
-        available_ids = {label_id for label_id, _ in label_options}
+        default_label_id = await self._async_default_label_id()
+        label_options = self._cached_label_choices()
+        available_ids, label_selector = _label_view(label_options)
 
         current_labels = [
             item for item in _current_labels_from_store(self._opts) if item in available_ids
@@ -532,7 +573,7 @@ class BacnetHubOptionsFlow(OptionsFlow):
 
         errors: Dict[str, str] = {}
         if user_input is not None:
-            selected_labels = _as_string_list(user_input.get(CONF_IMPORT_LABELS))
+            selected_labels = as_string_list(user_input.get(CONF_IMPORT_LABELS))
             selected_labels = [label_id for label_id in selected_labels if label_id in available_ids]
             if not selected_labels:
                 errors[CONF_IMPORT_LABELS] = "invalid_label_selection"
@@ -555,16 +596,7 @@ class BacnetHubOptionsFlow(OptionsFlow):
 
         schema = vol.Schema(
             {
-                vol.Required(CONF_IMPORT_LABELS, default=current_labels): sel.SelectSelector(
-                    sel.SelectSelectorConfig(
-                        options=[
-                            sel.SelectOptionDict(value=label_id, label=label_name)
-                            for label_id, label_name in label_options
-                        ],
-                        mode=sel.SelectSelectorMode.DROPDOWN,
-                        multiple=True,
-                    )
-                ),
+                vol.Required(CONF_IMPORT_LABELS, default=current_labels): label_selector,
             }
         )
         return self.async_show_form(
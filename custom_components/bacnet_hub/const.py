@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+from functools import lru_cache
+from typing import Any, Mapping
 
 DOMAIN = "bacnet_hub"
 DEFAULT_NAME = "BACnet Hub"
@@ -41,32 +42,66 @@ MIRRORED_STATE_ATTRIBUTE_EXCLUDE = frozenset(
     }
 )
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
 
-def _as_int(value: Any, fallback: int = 0) -> int:
+
+def as_int(value: Any, fallback: int = 0) -> int:
+    # Stored instances/counters are ints and absent keys are None; skip try/except for both.
+    if type(value) is int:
+        return value
+    if value is None:
+        return fallback
     try:
         return int(value)
     except Exception:
         return fallback
 
 
+def as_string_list(value: Any) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        text = value.strip()
+        return [text] if text else []
+    if isinstance(value, (list, tuple, set)):
+        result: list[str] = []
+        for item in value:
+            text = str(item).strip()
+            if text:
+                result.append(text)
+        return result
+    return []
+
+
+def is_ascii_digits(text: str, max_len: int) -> bool:
+    # Hub address fields: 1..max_len ASCII digits, shared by the UI and the server.
+    return 0 < len(text) <= max_len and text.isascii() and text.isdigit()
+
+
 def _slug_part(value: Any, fallback: str = "unknown") -> str:
     text = str(value or "").strip().lower()
     if not text:
         return fallback
-    slug = re.sub(r"[^a-z0-9]+", "_", text).strip("_")
+    slug = _SLUG_RE.sub("_", text).strip("_")
     return slug or fallback
 
 
+@lru_cache(maxsize=64)
 def object_type_slug(object_type: str) -> str:
     text = str(object_type or "").strip()
     if not text:
         return "obj"
     # Convert BACnet style camelCase names to kebab-case (e.g. analogValue -> analog-value).
-    return re.sub(r"(?<!^)(?=[A-Z])", "-", text).lower()
+    return _CAMEL_RE.sub("-", text).lower()
 
 
 def stable_hub_key(instance: Any, address: Any) -> str:
-    inst = _as_int(instance, 0)
+    return _stable_hub_key(as_int(instance, 0), str(address or ""))
+
+
+@lru_cache(maxsize=32)
+def _stable_hub_key(inst: int, address: str) -> str:
     addr = _slug_part(address, fallback="addr_unknown")
     return f"inst_{inst}_{addr}"
 
@@ -79,7 +114,7 @@ def published_unique_id(
     object_instance: Any,
 ) -> str:
     type_slug = object_type_slug(object_type)
-    inst = _as_int(object_instance, 0)
+    inst = as_int(object_instance, 0)
     return f"{DOMAIN}:hub:{stable_hub_key(hub_instance, hub_address)}:{type_slug}:{inst}"
 
 
@@ -96,8 +131,8 @@ def published_suggested_object_id(
         point_slug = "bv"
     else:
         point_slug = object_type_slug(object_type_key).replace("-", "_")
-    hub_inst = _as_int(hub_instance, 0)
-    inst = _as_int(object_instance, 0)
+    hub_inst = as_int(hub_instance, 0)
+    inst = as_int(object_instance, 0)
     return f"bacnet_doi_{hub_inst}_{point_slug}_{inst}"
 
 
@@ -154,20 +189,32 @@ def published_observer_unique_id(
     return f"{base}:{entity_domain}"
 
 
-def mirrored_state_attributes(attrs: dict[str, Any]) -> dict[str, Any]:
+def source_attr_name_suffix(source_attr: str) -> str:
+    # Mirror entity names end in the mirrored attribute, e.g. " Current Temperature".
+    if not source_attr:
+        return ""
+    return f" {source_attr.replace('_', ' ').title()}"
+
+
+def mirrored_state_attributes(attrs: Mapping[str, Any] | None) -> dict[str, Any]:
+    # Always a new dict: callers add their own keys to the result.
+    if not attrs:
+        return {}
+    if MIRRORED_STATE_ATTRIBUTE_EXCLUDE.isdisjoint(attrs):
+        return dict(attrs)
     return {
         key: value
-        for key, value in (attrs or {}).items()
+        for key, value in attrs.items()
         if key not in MIRRORED_STATE_ATTRIBUTE_EXCLUDE
     }
 
 
 def hub_display_name(instance: Any) -> str:
-    return f"BACnet Hub ({_as_int(instance, 0)})"
+    return f"BACnet Hub ({as_int(instance, 0)})"
 
 
 def client_display_name(instance: Any, object_name: Any | None = None) -> str:
-    inst = _as_int(instance, 0)
+    inst = as_int(instance, 0)
     name = str(object_name or "").strip()
     if name:
         return f"{name} ({inst})"
@@ -5,20 +5,29 @@ from typing import Any, Iterable, Optional
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, State
 
-_BINARY_DOMAINS = {
-    "binary_sensor",
-    "switch",
-    "light",
-    "lock",
-    "cover",
-    "input_boolean",
-    "alarm_control_panel",
-    "device_tracker",
-    "button",
-}
-
-_AUTO_WRITABLE_DOMAINS = {"light", "switch", "fan", "group", "cover", "number", "input_number"}
+_BINARY_DOMAINS = frozenset(
+    {
+        "binary_sensor",
+        "switch",
+        "light",
+        "lock",
+        "cover",
+        "input_boolean",
+        "alarm_control_panel",
+        "device_tracker",
+        "button",
+    }
+)
+
+_AUTO_WRITABLE_DOMAINS = frozenset(
+    {"light", "switch", "fan", "group", "cover", "number", "input_number"}
+)
+_STRINGY_BINARY = frozenset(
+    {"on", "off", "open", "closed", "true", "false", "active", "inactive"}
+)
 _SOURCE_STATE = "__state__"
+# First characters float() can accept: digits, sign, dot, "inf"/"nan".
+_NUMERIC_LEAD = frozenset("0123456789+-.iInN")
 _CLIMATE_SUFFIX: dict[str, str] = {
     "hvac_mode": "HVAC Mode",
     "hvac_action": "HVAC Action",
@@ -125,8 +134,13 @@ def _area_entry(area_reg: Any, area_id: str) -> Any:
 def _is_numeric_state(state: Optional[State]) -> bool:
     if not state:
         return False
+    raw = state.state
+    if isinstance(raw, str):
+        head = raw.lstrip()[:1]
+        if not head or (head.isascii() and head not in _NUMERIC_LEAD):
+            return False
     try:
-        float(state.state)
+        float(raw)
         return True
     except Exception:
         return False
@@ -144,7 +158,7 @@ def is_entity_auto_writable(hass: HomeAssistant, entity_id: str) -> bool:
     if not entity_id or "." not in entity_id:
         return False
 
-    domain = entity_id.split(".", 1)[0].lower()
+    domain = entity_id.partition(".")[0].lower()
     if domain not in _AUTO_WRITABLE_DOMAINS:
         return False
 
@@ -166,8 +180,7 @@ def is_entity_auto_writable(hass: HomeAssistant, entity_id: str) -> bool:
     return False
 
 
-def entity_friendly_name(hass: HomeAssistant, entity_id: str) -> str:
-    state = hass.states.get(entity_id)
+def _friendly_name_from_state(state: Optional[State], entity_id: str) -> str:
     if not state:
         return entity_id
     if getattr(state, "name", None):
@@ -184,9 +197,9 @@ def mapping_key(mapping: dict[str, Any]) -> str:
     return mapping_source_key(str(mapping.get("entity_id") or ""), mapping.get("source_attr"))
 
 
-def mapping_friendly_name(hass: HomeAssistant, mapping: dict[str, Any]) -> str:
+def mapping_friendly_name_from_state(state: Optional[State], mapping: dict[str, Any]) -> str:
     entity_id = str(mapping.get("entity_id") or "")
-    base = entity_friendly_name(hass, entity_id) if entity_id else "Unknown"
+    base = _friendly_name_from_state(state, entity_id) if entity_id else "Unknown"
     source_attr = str(mapping.get("source_attr") or "").strip().lower()
     suffix = _CLIMATE_SUFFIX.get(source_attr)
     if not suffix:
@@ -194,6 +207,12 @@ def mapping_friendly_name(hass: HomeAssistant, mapping: dict[str, Any]) -> str:
     return f"{base} {suffix}"
 
 
+def mapping_friendly_name(hass: HomeAssistant, mapping: dict[str, Any]) -> str:
+    entity_id = str(mapping.get("entity_id") or "")
+    state = hass.states.get(entity_id) if entity_id else None
+    return mapping_friendly_name_from_state(state, mapping)
+
+
 def _normalize_hvac_modes(raw_modes: Any, current_mode: Any) -> list[str]:
     modes: list[str] = []
     for item in (raw_modes or []):
@@ -222,13 +241,13 @@ def entity_mapping_candidates(hass: HomeAssistant, entity_id: str) -> list[dict[
     state = hass.states.get(entity_id)
 
     if domain != "climate":
-        object_type, units = determine_object_type_and_units(hass, entity_id)
+        object_type, units = _object_type_and_units_from_state(state, entity_id)
         base = {
             "entity_id": entity_id,
             "object_type": object_type,
             "units": units,
         }
-        base["friendly_name"] = mapping_friendly_name(hass, base)
+        base["friendly_name"] = mapping_friendly_name_from_state(state, base)
         return [base]
 
     attrs = dict(state.attributes) if state else {}
@@ -256,7 +275,7 @@ def entity_mapping_candidates(hass: HomeAssistant, entity_id: str) -> list[dict[
             "write_action": "climate_hvac_mode",
             "mv_states": hvac_modes,
         }
-    hvac["friendly_name"] = mapping_friendly_name(hass, hvac)
+    hvac["friendly_name"] = mapping_friendly_name_from_state(state, hvac)
     candidates.append(hvac)
 
     if "hvac_action" in attrs:
@@ -266,7 +285,7 @@ def entity_mapping_candidates(hass: HomeAssistant, entity_id: str) -> list[dict[
             "units": None,
             "source_attr": "hvac_action",
         }
-        hvac_action["friendly_name"] = mapping_friendly_name(hass, hvac_action)
+        hvac_action["friendly_name"] = mapping_friendly_name_from_state(state, hvac_action)
         candidates.append(hvac_action)
 
     temp_unit = attrs.get("temperature_unit") or attrs.get("unit_of_measurement")
@@ -278,7 +297,7 @@ def entity_mapping_candidates(hass: HomeAssistant, entity_id: str) -> list[dict[
             "source_attr": "current_temperature",
             "cov_increment": 0.2,
         }
-        cur_temp["friendly_name"] = mapping_friendly_name(hass, cur_temp)
+        cur_temp["friendly_name"] = mapping_friendly_name_from_state(state, cur_temp)
         candidates.append(cur_temp)
 
     if "temperature" in attrs:
@@ -291,17 +310,17 @@ def entity_mapping_candidates(hass: HomeAssistant, entity_id: str) -> list[dict[
             "write_action": "climate_temperature",
             "cov_increment": 0.1,
         }
-        tgt_temp["friendly_name"] = mapping_friendly_name(hass, tgt_temp)
+        tgt_temp["friendly_name"] = mapping_friendly_name_from_state(state, tgt_temp)
         candidates.append(tgt_temp)
 
     return candidates
 
 
-def determine_object_type_and_units(
-    hass: HomeAssistant, entity_id: str
+def _object_type_and_units_from_state(
+    state: Optional[State], entity_id: str
 ) -> tuple[str, Optional[str]]:
-    domain = (entity_id.split(".", 1)[0] if "." in entity_id else "").lower()
-    state = hass.states.get(entity_id)
+    head, sep, _ = entity_id.partition(".")
+    domain = head.lower() if sep else ""
 
     if domain in _BINARY_DOMAINS:
         return "binaryValue", None
@@ -312,7 +331,7 @@ def determine_object_type_and_units(
 
     if state:
         txt = str(state.state).strip().lower()
-        if txt in ("on", "off", "open", "closed", "true", "false", "active", "inactive"):
+        if txt in _STRINGY_BINARY:
             return "binaryValue", None
 
     return "binaryValue", None
@@ -427,8 +446,9 @@ def supported_entities_for_device(hass: HomeAssistant, device_id: str) -> list[s
     return entity_ids
 
 
-def entity_ids_for_label(hass: HomeAssistant, label_id: str) -> set[str]:
-    if not label_id:
+def entity_ids_for_labels(hass: HomeAssistant, label_ids: set[str]) -> set[str]:
+    """Resolve all labels in one pass over the entity registry."""
+    if not label_ids:
         return set()
 
     er_mod, ent_reg = _get_entity_registry(hass)
@@ -457,13 +477,13 @@ def entity_ids_for_label(hass: HomeAssistant, label_id: str) -> set[str]:
         if not entity_id or not is_supported_entity(hass, entity_id):
             continue
 
-        ent_labels = set(getattr(entry, "labels", set()) or set())
-        if label_id in ent_labels:
+        ent_labels = getattr(entry, "labels", None) or ()
+        if not label_ids.isdisjoint(ent_labels):
             result.add(entity_id)
             continue
 
         ent_area_id = getattr(entry, "area_id", None)
-        if label_id in _labels_for_area(ent_area_id):
+        if not label_ids.isdisjoint(_labels_for_area(ent_area_id)):
             result.add(entity_id)
             continue
 
@@ -471,25 +491,18 @@ def entity_ids_for_label(hass: HomeAssistant, label_id: str) -> set[str]:
         if not device_id or not dr_mod or not dev_reg:
             continue
         device = _device_entry(dev_reg, device_id)
-        dev_labels = set(getattr(device, "labels", set()) or set()) if device else set()
-        if label_id in dev_labels:
+        dev_labels = (getattr(device, "labels", None) or ()) if device else ()
+        if not label_ids.isdisjoint(dev_labels):
             result.add(entity_id)
             continue
 
         dev_area_id = getattr(device, "area_id", None) if device else None
-        if label_id in _labels_for_area(dev_area_id):
+        if not label_ids.isdisjoint(_labels_for_area(dev_area_id)):
             result.add(entity_id)
 
     return result
 
 
-def entity_ids_for_labels(hass: HomeAssistant, label_ids: set[str]) -> set[str]:
-    result: set[str] = set()
-    for label_id in label_ids:
-        result |= entity_ids_for_label(hass, label_id)
-    return result
-
-
 def entity_ids_for_areas(hass: HomeAssistant, area_ids: set[str]) -> set[str]:
     if not area_ids:
         return set()
@@ -30,15 +30,16 @@ class PublishedMappingsSensor(SensorEntity):
     def extra_state_attributes(self) -> Dict[str, Any]:
         # Compact list for device page
         items = []
+        states_get = self.hass.states.get
         for m in self._mappings:
+            st = states_get(str(m.get("entity_id") or ""))
             items.append({
                 "object_type": m.get("object_type"),
                 "instance": m.get("instance"),
                 "entity_id": m.get("entity_id"),
                 "source_attr": m.get("source_attr"),
                 "read_attr": m.get("read_attr"),
-                "name": self.hass.states.get(str(m.get("entity_id") or "")) and
-                        self.hass.states.get(str(m.get("entity_id") or "")).attributes.get("friendly_name"),
+                "name": st and st.attributes.get("friendly_name"),
                 "units": m.get("units"),
             })
         return {"items": items}
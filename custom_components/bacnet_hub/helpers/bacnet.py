@@ -8,6 +8,10 @@ _INSTANCE_SUFFIX_RE = re.compile(r"(?:,|:)\s*(\d+)\s*$")
 
 
 def _to_int(value: Any) -> int | None:
+    if type(value) is int:
+        return value
+    if value is None:
+        return None
     try:
         return int(value)
     except Exception:
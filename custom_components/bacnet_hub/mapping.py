@@ -11,6 +11,8 @@ OBJECT_TYPES: List[str] = [
     "binaryValue",
 ]
 
+_OBJECT_TYPE_SET = frozenset(OBJECT_TYPES)
+
 # Counter per type – used to assign instances sequentially
 DEFAULT_COUNTERS: Dict[str, int] = {t: 0 for t in OBJECT_TYPES}
 
@@ -25,6 +27,10 @@ def next_instance_for_type(obj_type: str, counters: Dict[str, int]) -> int:
 
 
 def _coerce_int(val: Any, fb: int) -> int:
+    if type(val) is int:
+        return val
+    if val is None:
+        return fb
     try:
         return int(val)
     except Exception:
@@ -50,7 +56,7 @@ def clean_published_list(items: Any) -> List[Dict[str, Any]]:
             continue
         ent = str(it.get("entity_id", "")).strip()
         typ = str(it.get("object_type", "")).strip()
-        if not ent or typ not in OBJECT_TYPES:
+        if not ent or typ not in _OBJECT_TYPE_SET:
             continue
         inst = _coerce_int(it.get("instance", 0), 0)
         units = it.get("units")
@@ -17,6 +17,7 @@ from .const import (
     published_entity_id,
     published_observer_unique_id,
     published_suggested_object_id,
+    source_attr_name_suffix,
 )
 
 
@@ -53,6 +54,8 @@ class BacnetPublishedNumberObserver(NumberEntity):
         self._configured_unit = configured_unit
         self._instance = int(instance)
         self._attr_name = name
+        self._name_prefix = f"(BACnet AV-{self._instance}) "
+        self._name_suffix = source_attr_name_suffix(self._source_attr)
         self._remove_listener: Callable[[], None] | None = None
         self._late_unsub: Optional[Callable[[], None]] = None
         self._attr_unique_id = published_observer_unique_id(
@@ -127,10 +130,7 @@ class BacnetPublishedNumberObserver(NumberEntity):
             self.async_write_ha_state()
             return
 
-        src_name = st.name or self._source
-        if self._source_attr:
-            src_name = f"{src_name} {self._source_attr.replace('_', ' ').title()}"
-        self._attr_name = f"(BACnet AV-{self._instance}) {src_name}"
+        self._attr_name = f"{self._name_prefix}{st.name or self._source}{self._name_suffix}"
 
         raw = _source_value(st, self._read_attr, self._source_attr)
         try:
@@ -142,7 +142,7 @@ class BacnetPublishedNumberObserver(NumberEntity):
             st.attributes.get("unit_of_measurement") or self._configured_unit
         )
         self._attr_icon = st.attributes.get("icon") or None
-        mirrored_attrs = mirrored_state_attributes(dict(st.attributes or {}))
+        mirrored_attrs = mirrored_state_attributes(st.attributes)
         mirrored_attrs["source_entity_id"] = self._source
         self._attr_extra_state_attributes = mirrored_attrs
         self.async_write_ha_state()
@@ -176,6 +176,8 @@ class BacnetPublishedSwitchObserver(SwitchEntity):
         self._hvac_on_mode = str(hvac_on_mode or "heat").strip().lower()
         self._instance = int(instance)
         self._attr_name = name
+        self._name_prefix = f"(BACnet BV-{self._instance}) "
+        self._name_suffix = source_attr_name_suffix(self._source_attr)
         self._remove_listener: Callable[[], None] | None = None
         self._late_unsub: Optional[Callable[[], None]] = None
         self._attr_unique_id = published_observer_unique_id(
@@ -249,10 +251,7 @@ class BacnetPublishedSwitchObserver(SwitchEntity):
             self.async_write_ha_state()
             return
 
-        src_name = st.name or self._source
-        if self._source_attr:
-            src_name = f"{src_name} {self._source_attr.replace('_', ' ').title()}"
-        self._attr_name = f"(BACnet BV-{self._instance}) {src_name}"
+        self._attr_name = f"{self._name_prefix}{st.name or self._source}{self._name_suffix}"
 
         raw = _source_value(st, self._read_attr, self._source_attr)
         txt = str(raw or "").strip().lower()
@@ -273,7 +272,7 @@ class BacnetPublishedSwitchObserver(SwitchEntity):
                 "cooling",
             )
         self._attr_icon = st.attributes.get("icon") or None
-        mirrored_attrs = mirrored_state_attributes(dict(st.attributes or {}))
+        mirrored_attrs = mirrored_state_attributes(st.attributes)
         mirrored_attrs["source_entity_id"] = self._source
         self._attr_extra_state_attributes = mirrored_attrs
         self.async_write_ha_state()
@@ -309,6 +308,8 @@ class BacnetPublishedSelectObserver(SelectEntity):
         self._read_attr = str(read_attr or "").strip()
         self._instance = int(instance)
         self._attr_name = name
+        self._name_prefix = f"(BACnet MV-{self._instance}) "
+        self._name_suffix = source_attr_name_suffix(self._source_attr)
         self._remove_listener: Callable[[], None] | None = None
         self._late_unsub: Optional[Callable[[], None]] = None
         self._attr_unique_id = published_observer_unique_id(
@@ -383,10 +384,7 @@ class BacnetPublishedSelectObserver(SelectEntity):
             self.async_write_ha_state()
             return
 
-        src_name = st.name or self._source
-        if self._source_attr:
-            src_name = f"{src_name} {self._source_attr.replace('_', ' ').title()}"
-        self._attr_name = f"(BACnet MV-{self._instance}) {src_name}"
+        self._attr_name = f"{self._name_prefix}{st.name or self._source}{self._name_suffix}"
 
         if not self._attr_options and self._source_attr == "hvac_mode":
             raw_modes = list(st.attributes.get("hvac_modes") or [])
@@ -411,7 +409,7 @@ class BacnetPublishedSelectObserver(SelectEntity):
         self._attr_current_option = current if current in self._attr_options else None
 
         self._attr_icon = st.attributes.get("icon") or None
-        mirrored_attrs = mirrored_state_attributes(dict(st.attributes or {}))
+        mirrored_attrs = mirrored_state_attributes(st.attributes)
         mirrored_attrs["source_entity_id"] = self._source
         self._attr_extra_state_attributes = mirrored_attrs
         self.async_write_ha_state()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -13,12 +14,16 @@ from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
 
-from .discovery import mapping_friendly_name, mapping_source_key
+from .discovery import (
+    mapping_friendly_name,
+    mapping_friendly_name_from_state,
+    mapping_source_key,
+)
 
 if TYPE_CHECKING:
     from homeassistant.core import State
 
-SUPPORTED_TYPES = {"binaryValue", "analogValue", "multiStateValue"}
+SUPPORTED_TYPES = frozenset({"binaryValue", "analogValue", "multiStateValue"})
 
 HA_UOM_TO_BACNET_ENUM_NAME: Dict[str, str] = {
     "\u00b0c": "degreesCelsius",
@@ -55,6 +60,24 @@ HA_UOM_TO_BACNET_ENUM_NAME: Dict[str, str] = {
     "km/h": "kilometersPerHour",
 }
 
+_FALSE_TEXT = frozenset({"0", "false", "off", "closed"})
+_TRUE_TEXT = frozenset({"1", "true", "on", "open", "heat", "cool", "heating", "cooling"})
+
+# BACnet -> HA write guard: HA services a mapping needs, by write_action and by domain.
+_ACTION_REQUIRED_SERVICE: Dict[str, Tuple[str, str]] = {
+    "climate_hvac_mode": ("climate", "set_hvac_mode"),
+    "climate_temperature": ("climate", "set_temperature"),
+}
+_DOMAIN_REQUIRED_SERVICES: Dict[str, Tuple[str, ...]] = {
+    "light": ("turn_on", "turn_off"),
+    "switch": ("turn_on", "turn_off"),
+    "fan": ("turn_on", "turn_off"),
+    "group": ("turn_on", "turn_off"),
+    "cover": ("open_cover", "close_cover"),
+    "number": ("set_value",),
+    "input_number": ("set_value",),
+}
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -82,12 +105,15 @@ def truthy(value: Any) -> bool:
     if "active" in text:
         return True
 
-    if text in ("0", "false", "off", "closed"):
+    if text in _FALSE_TEXT:
         return False
-    return text in ("1", "true", "on", "open", "heat", "cool", "heating", "cooling")
+    return text in _TRUE_TEXT
 
 
 def as_float(value: Any, default: float = 0.0) -> float:
+    # BACnet writes and HA numeric attributes are usually plain floats already.
+    if type(value) is float:
+        return value
     try:
         return float(value)
     except Exception:
@@ -95,12 +121,19 @@ def as_float(value: Any, default: float = 0.0) -> float:
 
 
 def as_int(value: Any, default: int = 0) -> int:
+    if type(value) is int:
+        return value
     try:
         return int(float(value))
     except Exception:
         return default
 
 
+def _mv_states(raw: Any) -> List[str]:
+    # One str/strip per stored state; blank entries are dropped.
+    return [text for text in (str(s).strip().lower() for s in raw or ()) if text]
+
+
 def source_value(state_obj: State, mapping: Dict[str, Any]) -> Any:
     read_attr = str(mapping.get("read_attr") or "").strip()
     source_attr = str(mapping.get("source_attr") or "").strip()
@@ -129,7 +162,7 @@ async def apply_from_ha(obj: Any, value: Any, mapping: Optional[Dict[str, Any]]
     elif isinstance(obj, MultiStateValueObject) or object_type == "multiStateValue":
         if value is None:
             return
-        states = [str(s).strip().lower() for s in ((mapping or {}).get("mv_states") or []) if str(s).strip()]
+        states = _mv_states((mapping or {}).get("mv_states"))
         if len(states) < 2:
             states = ["off", "on"]
         mode = str(value).strip().lower()
@@ -173,27 +206,27 @@ async def apply_from_ha(obj: Any, value: Any, mapping: Optional[Dict[str, Any]]
         object.__setattr__(obj, "_ha_guard", False)
 
 
-def is_mapping_auto_writable(hass: HomeAssistant, mapping: Dict[str, Any]) -> bool:
-    """Slim write guard: only mapping intent + required HA service availability."""
+def _resolve_write_target(hass: HomeAssistant, mapping: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """Return (write_action, target domain) if BACnet writes may reach HA, else None."""
     action = str(mapping.get("write_action") or "").strip()
-    if action == "climate_hvac_mode":
-        return hass.services.has_service("climate", "set_hvac_mode")
-    if action == "climate_temperature":
-        return hass.services.has_service("climate", "set_temperature")
+    required = _ACTION_REQUIRED_SERVICE.get(action)
+    if required is not None:
+        return (action, required[0]) if hass.services.has_service(*required) else None
 
     ent = str(mapping.get("entity_id") or "")
     domain = entity_domain(ent)
+    services = _DOMAIN_REQUIRED_SERVICES.get(domain)
+    if not services:
+        return None
 
-    if domain in ("light", "switch", "fan", "group"):
-        return hass.services.has_service(domain, "turn_on") and hass.services.has_service(domain, "turn_off")
-
-    if domain == "cover":
-        return hass.services.has_service("cover", "open_cover") and hass.services.has_service("cover", "close_cover")
+    if all(hass.services.has_service(domain, service) for service in services):
+        return action, domain
+    return None
 
-    if domain in ("number", "input_number"):
-        return hass.services.has_service(domain, "set_value")
 
-    return False
+def is_mapping_auto_writable(hass: HomeAssistant, mapping: Dict[str, Any]) -> bool:
+    """Slim write guard: only mapping intent + required HA service availability."""
+    return _resolve_write_target(hass, mapping) is not None
 
 
 async def forward_to_ha_from_bacnet(hass: HomeAssistant, mapping: Dict[str, Any], value: Any) -> None:
@@ -201,15 +234,16 @@ async def forward_to_ha_from_bacnet(hass: HomeAssistant, mapping: Dict[str, Any]
     if not ent:
         return
 
-    if not is_mapping_auto_writable(hass, mapping):
+    target = _resolve_write_target(hass, mapping)
+    if target is None:
         _LOGGER.debug("BACnet->HA write skipped for %s: auto-writable check failed", ent)
         return
 
-    action = str(mapping.get("write_action") or "").strip()
+    action, domain = target
     if action == "climate_hvac_mode":
         object_type = str(mapping.get("object_type") or "")
         if object_type == "multiStateValue":
-            states = [str(s).strip().lower() for s in (mapping.get("mv_states") or []) if str(s).strip()]
+            states = _mv_states(mapping.get("mv_states"))
             idx = as_int(value, 0)
             if idx < 1 or idx > len(states):
                 _LOGGER.warning("BACnet->HA climate hvac mode index out of range for %s: %r", ent, value)
@@ -241,8 +275,6 @@ async def forward_to_ha_from_bacnet(hass: HomeAssistant, mapping: Dict[str, Any]
         )
         return
 
-    domain = entity_domain(ent)
-
     if domain in ("light", "switch", "fan", "group"):
         on = truthy(value)
         await hass.services.async_call(
@@ -279,6 +311,7 @@ def _norm_uom_key(value: str) -> str:
     return key.replace(" c", "\u00b0c").replace("\u00b0 c", "\u00b0c").replace(" f", "\u00b0f").replace("\u00b0 f", "\u00b0f")
 
 
+@lru_cache(maxsize=64)
 def _resolve_units(value: Optional[str]) -> Optional[Any]:
     if not value:
         return None
@@ -399,6 +432,19 @@ class BacnetPublisher:
       - BACnet -> HA: Forwarding is called by server write handlers.
     """
 
+    __slots__ = (
+        "hass",
+        "app",
+        "_cfg",
+        "by_source",
+        "map_by_source",
+        "sources_by_entity",
+        "_targets_by_entity",
+        "by_oid",
+        "map_by_oid",
+        "_ha_unsub",
+    )
+
     def __init__(self, hass: HomeAssistant, app: Any, mappings: List[Dict[str, Any]]):
         self.hass = hass
         self.app = app
@@ -410,6 +456,7 @@ class BacnetPublisher:
         self.by_source: Dict[str, Any] = {}
         self.map_by_source: Dict[str, Dict[str, Any]] = {}
         self.sources_by_entity: Dict[str, List[str]] = {}
+        self._targets_by_entity: Dict[str, Tuple[Tuple[Any, Dict[str, Any]], ...]] = {}
 
         self.by_oid: Dict[Tuple[str, int], Any] = {}
         self.map_by_oid: Dict[Tuple[str, int], Dict[str, Any]] = {}
@@ -459,6 +506,14 @@ class BacnetPublisher:
                 getattr(obj, "units", None) if hasattr(obj, "units") else None,
             )
 
+        self._targets_by_entity = {
+            ent: tuple(
+                (self.by_source[source_key], self.map_by_source[source_key])
+                for source_key in source_keys
+            )
+            for ent, source_keys in self.sources_by_entity.items()
+        }
+
         await self._initial_sync()
 
         self._ha_unsub = async_track_state_change_event(
@@ -480,18 +535,23 @@ class BacnetPublisher:
         self.by_source.clear()
         self.map_by_source.clear()
         self.sources_by_entity.clear()
+        self._targets_by_entity = {}
         self.by_oid.clear()
         self.map_by_oid.clear()
         _LOGGER.info("BacnetPublisher stopped")
 
     async def update_descriptions(self) -> None:
         """Update BACnet object descriptions from current entity names."""
+        states: Dict[str, Any] = {}
         for source_key, obj in self.by_source.items():
             mapping = self.map_by_source.get(source_key)
             if not mapping:
                 continue
 
-            new_friendly = mapping_friendly_name(self.hass, mapping)
+            ent = str(mapping.get("entity_id") or "")
+            if ent not in states:
+                states[ent] = self.hass.states.get(ent) if ent else None
+            new_friendly = mapping_friendly_name_from_state(states[ent], mapping)
             current_desc = getattr(obj, "description", None)
             if new_friendly == current_desc:
                 continue
@@ -503,18 +563,15 @@ class BacnetPublisher:
                 _LOGGER.debug("Could not update description for %s: %s", source_key, err)
 
     async def _initial_sync(self) -> None:
-        for source_key, obj in self.by_source.items():
-            mapping = self.map_by_source.get(source_key)
-            if not mapping:
-                continue
-
-            ent = str(mapping.get("entity_id") or "")
-            st = self.hass.states.get(ent)
+        states_get = self.hass.states.get
+        for ent, targets in self._targets_by_entity.items():
+            st = states_get(ent)
             if not st:
                 continue
 
-            value = source_value(st, mapping)
-            await apply_from_ha(obj, value, mapping)
+            for obj, mapping in targets:
+                value = source_value(st, mapping)
+                await apply_from_ha(obj, value, mapping)
 
     @callback
     async def _on_state_changed(self, event) -> None:
@@ -527,12 +584,7 @@ class BacnetPublisher:
         if not ent or not ns:
             return
 
-        for source_key in self.sources_by_entity.get(ent, []):
-            obj = self.by_source.get(source_key)
-            mapping = self.map_by_source.get(source_key)
-            if not obj or not mapping:
-                continue
-
+        for obj, mapping in self._targets_by_entity.get(ent, ()):
             value = source_value(ns, mapping)
             asyncio.create_task(apply_from_ha(obj, value, mapping))
 
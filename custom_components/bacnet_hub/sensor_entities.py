@@ -22,6 +22,7 @@ from .const import (
     published_entity_id,
     published_observer_unique_id,
     published_suggested_object_id,
+    source_attr_name_suffix,
 )
 from .client_runtime import (
     CLIENT_COV_LEASE_SECONDS,
@@ -77,6 +78,8 @@ class BacnetPublishedSensor(SensorEntity):
         self._configured_unit = configured_unit
         self._instance = instance
         self._attr_name = name
+        self._name_prefix = f"(BACnet AV-{instance}) "
+        self._name_suffix = source_attr_name_suffix(self._source_attr)
         self._remove_listener = None
         self._late_unsub: Optional[Callable[[], None]] = None
         self._attr_unique_id = published_observer_unique_id(
@@ -165,12 +168,8 @@ class BacnetPublishedSensor(SensorEntity):
             self.async_write_ha_state()
             return
 
-        src_name = st.name or self._source
-        friendly_name = st.attributes.get("friendly_name") or src_name
-        if self._source_attr:
-            field_name = self._source_attr.replace("_", " ").title()
-            friendly_name = f"{friendly_name} {field_name}"
-        self._attr_name = f"(BACnet AV-{self._instance}) {friendly_name}"
+        friendly_name = st.attributes.get("friendly_name") or st.name or self._source
+        self._attr_name = f"{self._name_prefix}{friendly_name}{self._name_suffix}"
 
         attr_name = self._read_attr or self._source_attr
         source_value = st.attributes.get(attr_name) if attr_name else st.state
@@ -197,7 +196,7 @@ class BacnetPublishedSensor(SensorEntity):
                 self._attr_state_class = None
 
         self._attr_icon = st.attributes.get("icon") or None
-        mirrored_attrs = mirrored_state_attributes(dict(st.attributes or {}))
+        mirrored_attrs = mirrored_state_attributes(st.attributes)
         mirrored_attrs["source_entity_id"] = self._source
         self._attr_extra_state_attributes = mirrored_attrs
 
@@ -34,6 +34,7 @@ from .const import (
     DEFAULT_BACNET_OBJECT_NAME,
     DOMAIN,
     client_iam_signal,
+    is_ascii_digits,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,12 +46,6 @@ _BIND_RETRIES = 10
 _BIND_INITIAL_DELAY = 0.2
 _BIND_BACKOFF = 1.5
 
-_ADDR_RE = re.compile(
-    r"^\s*(?P<ip>(\d{1,3}\.){3}\d{1,3})"
-    r"(?:/(?P<prefix>\d{1,2}))?"
-    r"(?::(?P<port>\d{1,5}))?\s*$"
-)
-
 _SYSTEM_STATUS_LABELS: dict[int, str] = {
     0: "operational",
     1: "operational_read_only",
@@ -65,27 +60,38 @@ CLIENT_IAM_CACHE_KEY = "client_iam_cache"
 
 def _detect_local_ip() -> Optional[str]:
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
     except Exception:
         return None
 
 
+def _address_parts(addr: str) -> Optional[tuple[str, Optional[str], Optional[str]]]:
+    """Split 'ip[/prefix][:port]' into its text parts, or None if malformed."""
+    if addr.count(".") != 3:
+        return None
+    text = addr.strip()
+    head, sep, port = text.rpartition(":")
+    if not sep:
+        head, port = text, None
+    elif not is_ascii_digits(port, 5):
+        return None
+    ip, sep, prefix = head.partition("/")
+    if sep and not is_ascii_digits(prefix, 2):
+        return None
+    for octet in ip.split("."):
+        if not is_ascii_digits(octet, 3):
+            return None
+    return ip, (prefix if sep else None), port
+
+
 def _normalize_address(addr: Optional[str]) -> str:
     if addr:
-        m = _ADDR_RE.match(addr)
-        if m:
-            ip = m.group("ip")
-            prefix = m.group("prefix")
-            port = m.group("port")
-            try:
-                parts = [int(x) for x in ip.split(".")]
-                if any(p < 0 or p > 255 for p in parts):
-                    raise ValueError
-            except Exception:
+        parts_text = _address_parts(addr)
+        if parts_text:
+            ip, prefix, port = parts_text
+            if any(int(x) > 255 for x in ip.split(".")):
                 _LOGGER.warning("Address is not valid IPv4 (%s). Using fallback.", addr)
             else:
                 pfx = int(prefix) if prefix is not None else _DEFAULT_PREFIX
@@ -102,24 +108,22 @@ def _normalize_address(addr: Optional[str]) -> str:
 
 
 def _split_ip_port(address_str: str) -> tuple[str, int]:
-    m = _ADDR_RE.match(address_str)
-    if not m:
+    parts_text = _address_parts(address_str)
+    if not parts_text:
         raise ValueError(f"Invalid address: {address_str!r}")
-    ip = m.group("ip")
-    port = int(m.group("port") or _DEFAULT_PORT)
-    return ip, port
+    ip, _, port = parts_text
+    return ip, int(port or _DEFAULT_PORT)
 
 
 def _split_ip_prefix_port(address_str: str) -> tuple[str, int, int]:
-    m = _ADDR_RE.match(address_str)
-    if not m:
+    parts_text = _address_parts(address_str)
+    if not parts_text:
         raise ValueError(f"Invalid address: {address_str!r}")
-    ip = m.group("ip")
-    prefix = int(m.group("prefix") or _DEFAULT_PREFIX)
+    ip, prefix_text, port = parts_text
+    prefix = int(prefix_text or _DEFAULT_PREFIX)
     if prefix < 0 or prefix > 32:
         prefix = _DEFAULT_PREFIX
-    port = int(m.group("port") or _DEFAULT_PORT)
-    return ip, prefix, port
+    return ip, prefix, int(port or _DEFAULT_PORT)
 
 
 def _normalize_system_status(value: Any) -> tuple[int | None, str]: